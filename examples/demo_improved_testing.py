@@ -2,12 +2,27 @@
 """
 Demo script showcasing the improved test generation capabilities
 """
+import asyncio
+import hmac
+import operator
+from functools import lru_cache
 
+try:
+    # google-re2 matches in linear time (no backtracking); optional dependency
+    import re2 as _regex
+except ImportError:
+    import re as _regex
+
+_EMAIL_RE = _regex.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+@lru_cache(maxsize=4096)
 def validate_email(email):
     """Validate email format using regex"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    try:
+        return _EMAIL_RE.fullmatch(email) is not None
+    except UnicodeEncodeError:
+        # re2 cannot encode lone surrogates; they never match the ASCII pattern
+        return False
 
 def calculate_area(length, width):
     """Calculate area with validation"""
@@ -19,29 +34,92 @@ def calculate_area(length, width):
     
     return length * width
 
-async def fetch_user_data(user_id):
-    """Async function to fetch user data from API"""
-    import aiohttp
-    import asyncio
+# The shared session belongs to the event loop it was created on. Callers
+# should await close_session() before that loop exits (e.g. at the end of
+# the coroutine passed to asyncio.run) so pooled connections are released.
+_session = None
+_session_loop = None
+
+def _discard_stale_session():
+    """Drop a session whose event loop is gone without awaiting on it"""
+    global _session, _session_loop
+    
+    if _session is not None and not _session.closed:
+        # Its loop can no longer run close(); detach so it isn't reused
+        _session.detach()
+    _session = None
+    _session_loop = None
+
+async def _get_session():
+    """Return the shared HTTP session for the running loop, creating it on first use"""
+    global _session, _session_loop
     
+    loop = asyncio.get_running_loop()
+    if _session_loop is not loop:
+        _discard_stale_session()
+    
+    if _session is None or _session.closed:
+        # aiohttp is optional; only import it when a session is first needed
+        import aiohttp
+        
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+        _session_loop = loop
+    
+    return _session
+
+async def close_session():
+    """Close the shared HTTP session; call before the event loop exits"""
+    global _session, _session_loop
+    
+    if _session_loop is not asyncio.get_running_loop():
+        _discard_stale_session()
+        return
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+async def fetch_user_data(user_id):
+    """Async function to fetch user data from API (see close_session)"""
     if not user_id:
         raise ValueError("User ID is required")
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f'https://api.example.com/users/{user_id}') as response:
-            if response.status == 404:
-                raise ValueError("User not found")
-            elif response.status != 200:
-                raise RuntimeError(f"API error: {response.status}")
-            
-            return await response.json()
+    session = await _get_session()
+    async with session.get(f'https://api.example.com/users/{user_id}') as response:
+        if response.status == 404:
+            raise ValueError("User not found")
+        elif response.status != 200:
+            raise RuntimeError(f"API error: {response.status}")
+        
+        return await response.json()
+
+async def fetch_users_bulk(user_ids, concurrency=32):
+    """Fetch many users concurrently over the shared session"""
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_one(user_id):
+        async with semaphore:
+            return await fetch_user_data(user_id)
+    
+    return await asyncio.gather(
+        *(fetch_one(user_id) for user_id in user_ids),
+        return_exceptions=True
+    )
 
 class UserManager:
     """User management class with database operations"""
     
+    __slots__ = ('users',)
+    
     def __init__(self):
-        self.users = {}
-        self.cache = {}
+        # Ids are dense and monotonic, so index directly; slot 0 is unused
+        self.users = [None]
     
     def create_user(self, user_data):
         """Create a new user with validation"""
@@ -51,47 +129,64 @@ class UserManager:
         if not validate_email(user_data['email']):
             raise ValueError("Invalid email format")
         
-        user_id = len(self.users) + 1
-        user_data['id'] = user_id
-        self.users[user_id] = user_data
+        user_data['id'] = len(self.users)
+        self.users.append(user_data)
         
         return user_data
     
-    def get_user(self, user_id):
-        """Get user with caching"""
-        if user_id in self.cache:
-            return self.cache[user_id]
-        
-        user = self.users.get(user_id)
-        if user:
-            self.cache[user_id] = user
+    def _slot(self, user_id):
+        """Return the list index for user_id, or None if it names no slot"""
+        try:
+            index = operator.index(user_id)
+        except TypeError:
+            # As dict keys, ids also matched any number equal to an int,
+            # e.g. 1.0, Decimal(1), Fraction(1) or 1+0j
+            try:
+                index = int(getattr(user_id, 'real', user_id))
+            except (TypeError, ValueError, ArithmeticError):
+                return None
+            if index != user_id:
+                return None
         
-        return user
+        return index if 0 < index < len(self.users) else None
+    
+    def get_user(self, user_id):
+        """Get user by id"""
+        slot = self._slot(user_id)
+        return self.users[slot] if slot is not None else None
     
     def delete_user(self, user_id):
-        """Delete user and clear cache"""
-        if user_id in self.users:
-            del self.users[user_id]
-        
-        if user_id in self.cache:
-            del self.cache[user_id]
+        """Delete user"""
+        slot = self._slot(user_id)
+        if slot is not None:
+            # Leave a tombstone so ids are never reused
+            self.users[slot] = None
         
         return True
 
 def process_file(file_path):
     """Process file with error handling"""
     try:
+        total_lines = 1
+        processed_lines = 0
+        content_preview = []
+        
+        # Stream line by line so memory stays constant regardless of file size
         with open(file_path, 'r') as file:
-            content = file.read()
-            
-        # Process content
-        lines = content.split('\n')
-        processed_lines = [line.strip() for line in lines if line.strip()]
+            for line in file:
+                if line.endswith('\n'):
+                    total_lines += 1
+                
+                line = line.strip()
+                if line:
+                    processed_lines += 1
+                    if len(content_preview) < 5:
+                        content_preview.append(line)
         
         return {
-            'total_lines': len(lines),
-            'processed_lines': len(processed_lines),
-            'content_preview': processed_lines[:5]
+            'total_lines': total_lines,
+            'processed_lines': processed_lines,
+            'content_preview': content_preview
         }
     
     except FileNotFoundError:
@@ -106,11 +201,20 @@ def authenticate_user(username, password):
     if not username or not password:
         return {"success": False, "error": "Username and password required"}
     
-    # Simulate database lookup (with protection against injection)
-    safe_username = username.replace("'", "''")  # Basic SQL injection protection
+    # A real lookup should bind the username as a query parameter, e.g.
+    # conn.execute("... WHERE username = ?", (username,)), instead of
+    # escaping quotes by hand.
     
-    # Mock authentication logic
-    if username == "admin" and password == "secure_password_123":
+    # Mock authentication logic. compare_digest takes time independent of
+    # where the inputs differ; compare bytes since it rejects non-ASCII str.
+    # surrogatepass keeps lone surrogates from raising UnicodeEncodeError
+    if (
+        username == "admin"
+        and isinstance(password, str)
+        and hmac.compare_digest(
+            password.encode("utf-8", "surrogatepass"), b"secure_password_123"
+        )
+    ):
         return {
             "success": True,
             "user_id": 1,
@@ -1,14 +1,26 @@
+try:
+    # google-re2 matches in linear time (no backtracking); optional dependency
+    import re2 as _regex
+except ImportError:
+    import re as _regex
+
+_EMAIL_RE = _regex.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 def calculate_area(length, width):
     """Calculate the area of a rectangle."""
     return length * width
 
 def validate_email(email):
     """Validate email address format."""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    try:
+        return _EMAIL_RE.fullmatch(email) is not None
+    except UnicodeEncodeError:
+        # re2 cannot encode lone surrogates; they never match the ASCII pattern
+        return False
 
 class User:
+    __slots__ = ('email', 'name')
+
     def __init__(self, email, name):
         self.email = email
         self.name = name
\ No newline at end of file
@@ -9,6 +9,8 @@ def validate_email(email):
     return True
 
 class UserAccount:
+    __slots__ = ('username', 'email')
+
     def __init__(self, username, email):
         self.username = username
         self.email = email
@@ -1,12 +1,29 @@
 """
 Python Calculator with various patterns for comprehensive testing
 """
-import re
-from typing import List, Optional, Union
+try:
+    # google-re2 matches in linear time (no backtracking); optional dependency
+    import re2 as _regex  # type: ignore
+except ImportError:
+    import re as _regex
+from typing import TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Character-class bits for ASCII code points: 1 = upper, 2 = lower, 4 = digit
+_CHAR_CLASS = bytes(
+    chr(c).isupper() | chr(c).islower() << 1 | chr(c).isdigit() << 2
+    for c in range(128)
+)
 
 
 class Calculator:
-    def __init__(self):
+    __slots__ = ('result', 'history')
+
+    _EMAIL_RE = _regex.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+    def __init__(self) -> None:
         self.result: float = 0.0
         self.history: List[str] = []
 
@@ -36,11 +53,15 @@ class Calculator:
         if not isinstance(email, str):
             return False
         
-        if not email.strip():
+        email = email.strip()
+        if not email:
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
+        try:
+            return self._EMAIL_RE.fullmatch(email) is not None
+        except UnicodeEncodeError:
+            # re2 cannot encode lone surrogates; they never match the ASCII pattern
+            return False
 
     def fibonacci(self, n: int) -> int:
         """Calculate fibonacci number"""
@@ -50,10 +71,13 @@ class Calculator:
         if n < 0:
             raise ValueError("Input must be non-negative")
         
-        if n <= 1:
-            return n
-        
-        return self.fibonacci(n - 1) + self.fibonacci(n - 2)
+        # Fast doubling: F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = 0, 1
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            a, b = (d, c + d) if bit == '1' else (c, d)
+        return a
 
     def get_history(self) -> List[str]:
         """Get calculation history"""
@@ -67,10 +91,15 @@ class Calculator:
 
 def calculate_area(width: Union[int, float], height: Union[int, float]) -> Union[int, float]:
     """Calculate area of rectangle"""
-    if not isinstance(width, (int, float)) or not isinstance(height, (int, float)):
-        raise TypeError("Width and height must be numbers")
+    # Comparing against 0 already rejects non-numeric types, so no separate
+    # isinstance checks; evaluate both before raising ValueError
+    try:
+        width_invalid = width <= 0
+        height_invalid = height <= 0
+    except TypeError:
+        raise TypeError("Width and height must be numbers") from None
     
-    if width <= 0 or height <= 0:
+    if width_invalid or height_invalid:
         raise ValueError("Width and height must be positive")
     
     return width * height
@@ -92,8 +121,70 @@ def validate_password(password: str) -> bool:
     if len(password) < 8:
         return False
     
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
+    if password.isascii():
+        flags = 0
+        for code in password.encode('ascii'):
+            flags |= _CHAR_CLASS[code]
+            if flags == 7:
+                return True
+        return False
+    
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if not has_upper and c.isupper():
+            has_upper = True
+        elif not has_lower and c.islower():
+            has_lower = True
+        elif not has_digit and c.isdigit():
+            has_digit = True
+        
+        if has_upper and has_lower and has_digit:
+            return True
+    
+    return False
+
+
+# Longest password validate_passwords_bulk pads into its batch array
+_BULK_MAX_LENGTH = 128
+
+
+def validate_passwords_bulk(passwords: List[str]) -> "np.ndarray":
+    """Validate password strength for a batch of passwords (requires NumPy)"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "validate_passwords_bulk requires NumPy; install it with 'pip install numpy'"
+        ) from None
+    
+    results = np.zeros(len(passwords), dtype=bool)
+    
+    # Short ASCII passwords are classified together through the lookup table.
+    # Every row is padded to the longest one, so long outliers and non-ASCII
+    # input take the scalar path instead
+    ascii_indices = []
+    for i, password in enumerate(passwords):
+        if (
+            isinstance(password, str)
+            and len(password) <= _BULK_MAX_LENGTH
+            and password.isascii()
+        ):
+            ascii_indices.append(i)
+        else:
+            results[i] = validate_password(password)
+    
+    if not ascii_indices:
+        return results
+    
+    encoded = [passwords[i].encode('ascii') for i in ascii_indices]
+    lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(encoded))
+    width = max(int(lengths.max()), 1)
+    
+    # NUL padding maps to class 0, so it never sets a flag
+    codes = np.frombuffer(
+        b''.join(e.ljust(width, b'\0') for e in encoded), dtype=np.uint8
+    ).reshape(len(encoded), width)
+    flags = np.bitwise_or.reduce(np.frombuffer(_CHAR_CLASS, dtype=np.uint8)[codes], axis=1)
     
-    return has_upper and has_lower and has_digit
\ No newline at end of file
+    results[ascii_indices] = (flags == 7) & (lengths >= 8)
+    return results